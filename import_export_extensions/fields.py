@@ -2,6 +2,8 @@ from django.db.models.fields.reverse_related import ManyToManyRel
 
 from import_export.fields import Field
 
+from .widgets import IntermediateManyToManyWidget
+
 
 class IntermediateManyToManyField(Field):
     """Resource field for M2M with custom ``through`` model.
@@ -66,7 +68,13 @@ class IntermediateManyToManyField(Field):
             obj,
             m2m_rel,
         )
-        return getattr(obj, through_model_accessor_name).all()
+        queryset = getattr(obj, through_model_accessor_name).all()
+        prefetched_objects = getattr(obj, "_prefetched_objects_cache", {})
+        if through_model_accessor_name in prefetched_objects or not isinstance(
+            self.widget, IntermediateManyToManyWidget
+        ):
+            return queryset
+        return self.widget.optimize_queryset(queryset)
 
     def get_relation_field_params(self, obj):
         """Shortcut to get relation field params.
@@ -18,6 +18,7 @@ from import_export import fields, resources
 from import_export.formats import base_formats
 
 from .results import Error, Result, RowResult
+from .widgets import FileWidget
 
 
 class TaskState(enum.Enum):
@@ -105,13 +106,20 @@ class CeleryResourceMixin:
         return cls.SUPPORTED_FORMATS
 
     @classmethod
+    @functools.cache
     def get_supported_extensions_map(
         cls,
     ) -> dict[
         str,
         type[base_formats.Format],
     ]:
-        """Get a map of supported formats and their extensions."""
+        """Get a map of supported formats and their extensions.
+
+        Result is cached per resource class, since `SUPPORTED_FORMATS` are
+        defined on class level and building map requires instantiating
+        each format class.
+
+        """
         return {
             supported_format().get_extension(): supported_format
             for supported_format in cls.SUPPORTED_FORMATS
@@ -132,6 +140,9 @@ class CeleryResourceMixin:
 
         If `force_import=True`, then rows with errors will be skipped.
 
+        Files primed by file widgets in ``before_import`` are reset after
+        import, even if it's failed and ``after_import`` isn't called.
+
         """
         self.initialize_task_state(
             state=(
@@ -141,16 +152,41 @@ class CeleryResourceMixin:
             ),
             queryset=dataset,
         )
-        return super().import_data(  # type: ignore
-            dataset=dataset,
-            dry_run=dry_run,
-            raise_errors=raise_errors,
-            use_transactions=use_transactions,
-            collect_failed_rows=collect_failed_rows,
-            rollback_on_validation_errors=rollback_on_validation_errors,
-            force_import=force_import,
-            **kwargs,
-        )
+        try:
+            return super().import_data(  # type: ignore
+                dataset=dataset,
+                dry_run=dry_run,
+                raise_errors=raise_errors,
+                use_transactions=use_transactions,
+                collect_failed_rows=collect_failed_rows,
+                rollback_on_validation_errors=rollback_on_validation_errors,
+                force_import=force_import,
+                **kwargs,
+            )
+        finally:
+            for widget, _column_name in self._get_primed_file_widgets(
+                dataset,
+            ):
+                widget.reset_primed_files()
+
+    def before_import(self, dataset: tablib.Dataset, **kwargs):
+        """Prime file widgets with files from dataset."""
+        super().before_import(dataset, **kwargs)  # type: ignore
+        for widget, column_name in self._get_primed_file_widgets(dataset):
+            widget.prime(dataset[column_name])
+
+    def _get_primed_file_widgets(
+        self,
+        dataset: tablib.Dataset,
+    ) -> list[tuple[FileWidget, str]]:
+        """Get file widgets which should be primed with their columns."""
+        return [
+            (field.widget, field.column_name)
+            for field in self.fields.values()
+            if isinstance(field.widget, FileWidget)
+            and field.widget.prime_existing_files
+            and field.column_name in (dataset.headers or ())
+        ]
 
     def import_row(
         self,
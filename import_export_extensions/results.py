@@ -1,4 +1,5 @@
 import collections
+import traceback
 import typing
 
 from django.core.exceptions import ValidationError
@@ -9,19 +10,34 @@ from import_export import results
 class Error(results.Error):
     """Customization of over base Error class from import export."""
 
+    def __init__(self, error: typing.Any, *args, **kwargs) -> None:
+        """Store string representation of `error` and its traceback.
+
+        `error` object may contain not picklable objects (for example,
+        django's lazy text), so here it replaced with simple string once,
+        instead of resolving it on each pickling or rendering. Traceback
+        can't be formatted from string, so it's formatted beforehand.
+
+        """
+        self._traceback = (
+            "".join(traceback.format_exception(error))
+            if isinstance(error, BaseException)
+            else ""
+        )
+        super().__init__(
+            str(error) if error is not None else error,
+            *args,
+            **kwargs,
+        )
+
     def __repr__(self) -> str:
         """Return object representation in string format."""
         return f"Error({self.error})"
 
-    def __reduce__(self):
-        """Simplify Exception object for pickling.
-
-        `error` object may contain not picklable objects (for example, django's
-        lazy text), so here it replaced with simple string.
-
-        """
-        self.error = str(self.error)
-        return super().__reduce__()
+    @property
+    def traceback(self) -> str:
+        """Return formatted traceback of original error."""
+        return self._traceback
 
 
 class RowResult(results.RowResult):
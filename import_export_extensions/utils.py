@@ -1,4 +1,5 @@
-import pathlib
+import functools
+import mimetypes
 import re
 import typing
 import unicodedata
@@ -11,6 +12,18 @@ from django.db.models import Q
 import requests
 from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 
+# Extensions of MIME types commonly met in imported files
+COMMON_FILE_EXTENSIONS = {
+    "application/json": ".json",
+    "application/pdf": ".pdf",
+    "image/gif": ".gif",
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "text/csv": ".csv",
+    "text/plain": ".txt",
+}
+
 
 def normalize_string_value(value: str) -> str:
     """Normalize string value.
@@ -71,13 +84,29 @@ def get_file_extension(url: str, lower: bool = True) -> str:
         'dir/subdir/file.ext' -> '.ext'
 
     """
-    get_index = url.find("?")
-    if get_index != -1:
-        url = url[:get_index]  # remove GET params from URL
-    ext = pathlib.Path(url).suffix
+    # drop GET params from URL, '#' is kept since file name may contain it
+    filename = url.partition("?")[0].rpartition("/")[2]
+    stem, _, ext = filename.rpartition(".")
+    if not stem or not ext:
+        return ""
+    ext = f".{ext}"
     return ext.lower() if lower else ext
 
 
+@functools.lru_cache(maxsize=64)
+def guess_file_extension(mime_type: str) -> str | None:
+    """Guess file extension by MIME type.
+
+    Common MIME types are resolved without `mimetypes`, which loads system
+    MIME databases on first call. Result is cached, since only a few MIME
+    types are usually met in imported files.
+
+    """
+    if mime_type in COMMON_FILE_EXTENSIONS:
+        return COMMON_FILE_EXTENSIONS[mime_type]
+    return mimetypes.guess_extension(mime_type)
+
+
 def remove_illegal_characters(value: str) -> str:
     """Remove `illegal` characters from string values.
 
@@ -149,6 +178,35 @@ def clean_sequence_of_string_values(
     return list(sequence)
 
 
+def split_and_clean_string_values(
+    value: str,
+    separator: str,
+    ignore_empty: bool = True,
+) -> list[str]:
+    """Split string value by separator and clean each part.
+
+    Same as ``clean_sequence_of_string_values(value.split(separator))``,
+    but builds result in single pass over split parts.
+
+    Args:
+        value: string to split
+        separator: separator to split string by
+        ignore_empty: boolean value which defines should empty strings be
+        removed from sequence or not
+
+    Returns:
+        cleared_sequence: list of cleared parts of string
+
+    """
+    if ignore_empty:
+        return [
+            cleaned_item
+            for item in value.split(separator)
+            if (cleaned_item := normalize_string_value(item))
+        ]
+    return [normalize_string_value(item) for item in value.split(separator)]
+
+
 def url_to_internal_value(file_url: str) -> str:
     """Convert file url to internal value."""
     file_url = unquote_plus(file_url)
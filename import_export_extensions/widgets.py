@@ -1,9 +1,15 @@
-import mimetypes
+import collections
+import functools
+import operator
+import posixpath
 import typing
 from urllib.parse import urlparse
 
 from django.conf import settings
-from django.core.exceptions import SuspiciousFileOperation
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    SuspiciousFileOperation,
+)
 from django.core.files import File
 from django.core.files.storage import default_storage
 from django.db.models import Model, Q, QuerySet
@@ -77,6 +83,26 @@ class IntermediateManyToManyWidget(ManyToManyWidget):
         self.rem_field_lookup = rem_field_lookup
         self.extra_fields = extra_fields or []
         self.render_empty = render_empty
+        # fields chains like `field1__field2` are converted to getters once,
+        # since they are used for each rendered row
+        self._rem_field_getter = self._get_field_getter(rem_field)
+        self._extra_fields_getters = tuple(
+            self._get_field_getter(field) for field in self.extra_fields
+        )
+        self._get_instance_filter = self._get_instance_filter_builder()
+        # only related object's pk is rendered, so props are not needed
+        self._render_pk_only = rem_field == "pk" and not self.extra_fields
+        # name of intermediate model field, which points to `rem_model`
+        self._rem_field_name: str | None = None
+        # fields for `values_list` per intermediate model, `None` if some of
+        # rendered fields isn't a DB column
+        self._values_fields: dict[type[Model], list[str] | None] = {}
+        # relations to select for intermediate instances per intermediate
+        # model, they are used for each exported object
+        self._select_related_fields: dict[type[Model], list[str]] = {}
+        # related objects of instances cleaned by ``clean``, used by
+        # ``clean_instance`` instead of querying each object separately
+        self._rem_objects_map: dict[str, list[Model]] = {}
 
     def render(
         self,
@@ -91,17 +117,32 @@ class IntermediateManyToManyWidget(ManyToManyWidget):
             "5:1990-12-12;19:2005-08-16"
             where 5 is band id
 
+        If `rem_field` and `extra_fields` are DB columns and `value` is not
+        evaluated queryset, then values are fetched via ``values_list``
+        without instantiating intermediate and related models.
+
         Args:
             value(QuerySet): instances of intermediate model
 
         """
-        instances = [
-            self.render_instance(i, self._get_related_instance(i))
-            for i in value
-        ]
+        values_fields = self._get_values_fields(value)
+        instances: typing.Iterator[str]
+        if values_fields:
+            join_props = self.prop_separator.join
+            instances = (
+                join_props(map(smart_str, row))
+                for row in value.values_list(*values_fields)
+            )
+        else:
+            # bind methods once, since they are called for each instance
+            render_instance = self.render_instance
+            get_related_instance = self._get_related_instance
+            instances = (
+                render_instance(i, get_related_instance(i)) for i in value
+            )
         # Clean empty instances
         if not self.render_empty:
-            instances = list(filter(None, instances))
+            instances = filter(None, instances)
 
         return self.instance_separator.join(instances)
 
@@ -116,47 +157,181 @@ class IntermediateManyToManyWidget(ManyToManyWidget):
             related_object: associated object (i.e. Band)
 
         """
+        if self._render_pk_only:
+            return smart_str(related_object.pk)
+
         # get related object (i.e. Band)
         props = [
-            smart_str(self._get_field_value(related_object, self.rem_field)),
+            smart_str(self._rem_field_getter(related_object)),
             *[
-                smart_str(self._get_field_value(instance, attr))
-                for attr in self.extra_fields
+                smart_str(getter(instance))
+                for getter in self._extra_fields_getters
             ],
         ]
 
         return self.prop_separator.join(props)
 
-    def _get_field_value(self, obj: Model, field: str) -> typing.Any:
-        """Get `field` value from an object.
+    def _get_field_getter(
+        self,
+        field: str,
+    ) -> typing.Callable[[Model], typing.Any]:
+        """Get callable returning `field` value from an object.
 
         Support chained fields like `field1__field2__field3` which allows to
         get values from obj.field1.field2.field3
 
         """
-        fields_chain = field.split("__")
-        value = obj
-        for s in fields_chain:
-            value = getattr(value, s)
-
-        return value
+        return operator.attrgetter(field.replace("__", "."))
 
     def _get_related_instance(self, instance: Model) -> Model:
         """Get related instance based on IntermediateModel instance.
 
         i.e. get Band based on Membership instance
 
+        Name of the field pointing to related model is looked up once and
+        cached on the widget.
+
         Args:
             instance: instance of intermediate model
 
         """
-        for field in instance._meta.get_fields():
+        if self._rem_field_name is None:
+            self._rem_field_name = self._get_rem_field_name(
+                instance._meta.model,
+            )
+            if self._rem_field_name is None:
+                return None
+        return getattr(instance, self._rem_field_name)
+
+    def _get_rem_field_name(
+        self,
+        intermediate_model: type[Model],
+    ) -> str | None:
+        """Get name of intermediate model field pointing to `rem_model`."""
+        for field in intermediate_model._meta.get_fields():
             if field.related_model == self.rem_model:
-                return getattr(instance, field.name)
+                return field.name
+        return None
+
+    def optimize_queryset(self, queryset: QuerySet) -> QuerySet:
+        """Select related objects required to render intermediate instances.
+
+        Joins related model (i.e. Band) and all relations from `rem_field`
+        and `extra_fields` chains, so ``render`` doesn't make additional
+        queries for each intermediate instance. Queryset is returned as is
+        if ``render`` fetches its values via ``values_list``.
+
+        Args:
+            queryset(QuerySet): instances of intermediate model
+
+        """
+        if self._get_values_fields(queryset):
+            return queryset
+
+        if queryset.model not in self._select_related_fields:
+            self._select_related_fields[queryset.model] = (
+                self._get_select_related_fields(queryset.model)
+            )
+        select_related_fields = self._select_related_fields[queryset.model]
+        if not select_related_fields:
+            return queryset
+        return queryset.select_related(*select_related_fields)
+
+    def _get_select_related_fields(
+        self,
+        intermediate_model: type[Model],
+    ) -> list[str]:
+        """Get relations to select for intermediate model instances."""
+        rem_field_name = self._get_rem_field_name(intermediate_model)
+        if rem_field_name is None:
+            return []
+
+        relations = [
+            self._get_relation_path(intermediate_model, fields_chain)
+            for fields_chain in (
+                f"{rem_field_name}__{self.rem_field}",
+                *self.extra_fields,
+            )
+        ]
+        return list(filter(None, relations))
+
+    def _get_values_fields(
+        self,
+        value: typing.Iterable[Model],
+    ) -> list[str] | None:
+        """Get fields to render `value` using ``values_list``.
+
+        Return `None` if `value` is not a queryset or it's already evaluated
+        (i.e. prefetched), if ``render_instance`` is customized or if some of
+        rendered fields isn't a DB column.
+
+        """
+        if (
+            not isinstance(value, QuerySet)
+            or value._result_cache is not None
+            or type(self).render_instance
+            is not IntermediateManyToManyWidget.render_instance
+        ):
+            return None
+
+        if value.model not in self._values_fields:
+            rem_field_name = self._get_rem_field_name(value.model)
+            values_fields = [
+                f"{rem_field_name}__{self.rem_field}",
+                *self.extra_fields,
+            ]
+            self._values_fields[value.model] = (
+                values_fields
+                if rem_field_name is not None
+                and all(
+                    self._is_column_path(value.model, field)
+                    for field in values_fields
+                )
+                else None
+            )
+        return self._values_fields[value.model]
+
+    def _is_column_path(self, model: type[Model], field: str) -> bool:
+        """Check that fields chain points to DB column.
+
+        All fields in chain except last one should be forward relations and
+        last one should be concrete non-relational field.
+
+        """
+        *relations, column = field.split("__")
+        if self._get_relation_path(model, field) != "__".join(relations):
+            return False
+        for field_name in relations:
+            model = model._meta.get_field(field_name).related_model
+        if column == "pk":
+            return True
+        try:
+            model_field = model._meta.get_field(column)
+        except FieldDoesNotExist:
+            return False
+        return model_field.concrete and not model_field.is_relation
+
+    def _get_relation_path(self, model: type[Model], field: str) -> str:
+        """Get part of fields chain which consists of forward relations.
+
+        For example, for `band__label__title` it returns `band__label`.
+
+        """
+        relation_path = []
+        for field_name in field.split("__"):
+            try:
+                model_field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                break
+            if not (model_field.many_to_one or model_field.one_to_one):
+                break
+            relation_path.append(field_name)
+            model = model_field.related_model
+        return "__".join(relation_path)
 
     def clean(
         self,
-        value: str,
+        value: str | int,
         *args,
         **kwargs,
     ) -> list[dict[str, typing.Any]]:
@@ -166,7 +341,8 @@ class IntermediateManyToManyWidget(ManyToManyWidget):
         restore it
 
         Args:
-            value(str): rendered data about instance of intermediate model
+            value(str | int): rendered data about instance of intermediate
+                model, may be integer if it's a single pk
             instance:
 
         Returns:
@@ -180,27 +356,43 @@ class IntermediateManyToManyWidget(ManyToManyWidget):
             return []  # pragma: no cover
 
         # if value is one integer number
-        value = str(value)
+        if not isinstance(value, str):
+            value = str(value)
 
         # in some cases if click `enter` values `\n\r` inserted
         if self.instance_separator == "\n":  # pragma: no cover
             value = value.replace("\r", "")
 
-        raw_instances = utils.clean_sequence_of_string_values(
-            value.split(self.instance_separator),
+        if self.instance_separator in value:
+            raw_instances = utils.split_and_clean_string_values(
+                value,
+                self.instance_separator,
+            )
+        else:
+            # single instance is the most common case, no need to split it
+            raw_instances = utils.clean_sequence_of_string_values((value,))
+
+        # single instance is fetched in ``clean_instance`` anyway
+        self._rem_objects_map = (
+            self.get_rem_objects_map(raw_instances)
+            if len(raw_instances) > 1
+            else {}
         )
 
         result = []
         invalid_instances = []
-        restored_objects_ids = []
-        for raw_instance in raw_instances:
-            try:
-                for item in self.clean_instance(raw_instance):
-                    if item["object"].pk not in restored_objects_ids:
-                        restored_objects_ids.append(item["object"].pk)
-                        result.append(item)
-            except ValueError:
-                invalid_instances.append(raw_instance)
+        restored_objects_ids = set()
+        try:
+            for raw_instance in raw_instances:
+                try:
+                    for item in self.clean_instance(raw_instance):
+                        if item["object"].pk not in restored_objects_ids:
+                            restored_objects_ids.add(item["object"].pk)
+                            result.append(item)
+                except ValueError:
+                    invalid_instances.append(raw_instance)
+        finally:
+            self._rem_objects_map = {}
 
         # if there are entries in `invalid_instances`
         if invalid_instances:
@@ -233,7 +425,11 @@ class IntermediateManyToManyWidget(ManyToManyWidget):
             }
 
         """
-        props = raw_instance.split(self.prop_separator)
+        props = utils.split_and_clean_string_values(
+            raw_instance,
+            self.prop_separator,
+            ignore_empty=False,
+        )
 
         if len(props) > len(self.extra_fields) + 1:
             # +1 is for `self.rem_field`
@@ -246,52 +442,156 @@ class IntermediateManyToManyWidget(ManyToManyWidget):
         # i.e. PK of Band
         # props contain other saved properties of intermediate model
         # i.e. `date_joined`
-        rem_field_value, *props = utils.clean_sequence_of_string_values(
-            raw_instance.split(self.prop_separator),
-            ignore_empty=False,
-        )
+        rem_field_value, *props = props
 
-        # get related objects
-        qs = self.filter_instances(rem_field_value)
+        # get related objects, fetched by ``clean`` for all instances or
+        # evaluate queryset once, since objects are required anyway
+        rem_objects = self._rem_objects_map.get(rem_field_value)
+        if rem_objects is None:
+            rem_objects = list(self.filter_instances(rem_field_value))
 
         # if we tries import nonexistent instance
-        if not qs.exists():
+        if not rem_objects:
             raise ValueError(f"Invalid instance {raw_instance}")
 
         # build dict with other properties. Ignore extra fields which has
-        # empty strings values
-        other_props = {
-            key: value
-            for key, value in zip(self.extra_fields, props, strict=False)
-            if value
-        }
+        # empty strings values. Length of `props` is already checked, so
+        # props may be matched with extra fields by index
+        other_props = {}
+        for index, value in enumerate(props):
+            if value:
+                other_props[self.extra_fields[index]] = value
         return [
             {"object": rem_object, "properties": other_props}
-            for rem_object in qs
+            for rem_object in rem_objects
         ]
 
+    def get_rem_objects_map(
+        self,
+        raw_instances: list[str],
+    ) -> dict[str, list[Model]]:
+        """Fetch related objects for all raw instances with single query.
+
+        Works only for exact match of `rem_field` and if
+        ``filter_instances`` isn't customized, otherwise related objects are
+        fetched for each instance in ``clean_instance``.
+
+        Returns:
+            dict: map of `rem_field` values to related objects
+
+        """
+        if (
+            self.rem_field_lookup
+            or not raw_instances
+            or type(self).filter_instances
+            is not IntermediateManyToManyWidget.filter_instances
+        ):
+            return {}
+
+        rem_field_values = {
+            utils.normalize_string_value(
+                raw_instance.split(self.prop_separator, 1)[0],
+            )
+            for raw_instance in raw_instances
+        }
+        try:
+            # values are converted to `rem_field` type on filtering
+            queryset = self.rem_model.objects.filter(
+                **{f"{self.rem_field}__in": rem_field_values},
+            )
+            relation_path = self._get_relation_path(
+                self.rem_model,
+                self.rem_field,
+            )
+            if relation_path:
+                queryset = queryset.select_related(relation_path)
+            rem_objects = list(queryset)
+        except (TypeError, ValueError):
+            # some of values are invalid for `rem_field` (i.e. not numeric
+            # pk), they will be reported by ``clean_instance``
+            return {}
+
+        rem_objects_map = collections.defaultdict(list)
+        for rem_object in rem_objects:
+            rem_field_value = smart_str(self._rem_field_getter(rem_object))
+            rem_objects_map[rem_field_value].append(rem_object)
+        return dict(rem_objects_map)
+
     def filter_instances(self, rem_field_value: str) -> QuerySet:
         """Shortcut to filter corresponding instances."""
-        if self.rem_field_lookup:
-            if self.rem_field_lookup == "regex":
-                instance_filter = utils.get_clear_q_filter(
-                    rem_field_value,
-                    self.rem_field,
-                )
-            else:
-                lookup = f"{self.rem_field}__{self.rem_field_lookup}"
-                instance_filter = Q(**{lookup: rem_field_value})
-        else:
-            instance_filter = Q(**{self.rem_field: rem_field_value})
+        return self.rem_model.objects.filter(
+            self._get_instance_filter(rem_field_value),
+        )
 
-        return self.rem_model.objects.filter(instance_filter)
+    def _get_instance_filter_builder(self) -> typing.Callable[[str], Q]:
+        """Get function building filter for `rem_field` value.
+
+        Lookup doesn't change, so function is chosen once on init.
+
+        """
+        if self.rem_field_lookup == "regex":
+            return functools.partial(
+                utils.get_clear_q_filter,
+                attribute_name=self.rem_field,
+            )
+
+        lookup = (
+            f"{self.rem_field}__{self.rem_field_lookup}"
+            if self.rem_field_lookup
+            else self.rem_field
+        )
+        return lambda rem_field_value: Q(**{lookup: rem_field_value})
 
 
 class FileWidget(CharWidget):
     """Widget for working with File fields."""
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, prime_existing_files: bool = False):
+        """Init widget.
+
+        Args:
+            filename(str): name for downloaded files
+            prime_existing_files(bool): if True, resource lists storage
+                directories of imported files once before import (see
+                ``prime``) instead of checking each file existence
+
+        """
         self.filename = filename
+        self.prime_existing_files = prime_existing_files
+        # paths of files known to exist in storage, filled by ``prime``
+        self._existing_files: set[str] = set()
+
+    def prime(self, values: typing.Iterable[typing.Any]) -> None:
+        """Remember which files of imported `values` exist in storage.
+
+        Each directory of files is listed once, so ``clean`` doesn't need
+        to request storage for each file (i.e. HEAD request for S3).
+        Non-string values (i.e. numbers from XLSX) are skipped, they are
+        reported for their rows by ``clean``.
+
+        """
+        directories = set()
+        for value in values:
+            if not value or not isinstance(value, str):
+                continue
+            internal_url = utils.url_to_internal_value(urlparse(value).path)
+            if internal_url:
+                directories.add(posixpath.dirname(internal_url))
+
+        existing_files: set[str] = set()
+        for directory in directories:
+            try:
+                _, files = default_storage.listdir(directory)
+            except (FileNotFoundError, SuspiciousFileOperation):
+                continue
+            existing_files.update(
+                posixpath.join(directory, file) for file in files
+            )
+        self._existing_files = existing_files
+
+    def reset_primed_files(self) -> None:
+        """Forget files remembered by ``prime``."""
+        self._existing_files = set()
 
     def render(
         self,
@@ -303,10 +603,7 @@ class FileWidget(CharWidget):
         if not value:
             return None
 
-        if self._get_default_storage() == DEFAULT_SYSTEM_STORAGE:
-            return f"http://localhost:8000{value.url}"
-
-        return value.url
+        return self._url_prefix + value.url
 
     def clean(
         self,
@@ -323,6 +620,9 @@ class FileWidget(CharWidget):
         if not internal_url:
             raise ValidationError("Invalid file path")
 
+        if internal_url in self._existing_files:
+            return internal_url
+
         try:
             if default_storage.exists(internal_url):
                 return internal_url
@@ -334,12 +634,24 @@ class FileWidget(CharWidget):
     def _get_file(self, url: str) -> File:
         """Download file from the external resource."""
         file = utils.download_file(url)
-        ext = mimetypes.guess_extension(file.content_type)
+        ext = utils.guess_file_extension(file.content_type)
         filename = f"{self.filename}.{ext}" if ext else self.filename
 
         return File(file, filename)
 
-    def _get_default_storage(self) -> str:
+    @functools.cached_property
+    def _url_prefix(self) -> str:
+        """Return prefix for file URLs.
+
+        Local storage returns relative URLs, so they are prefixed with host.
+
+        """
+        if self._default_storage == DEFAULT_SYSTEM_STORAGE:
+            return "http://localhost:8000"
+        return ""
+
+    @functools.cached_property
+    def _default_storage(self) -> str:
         """Return default system storage used in project.
 
         Use the value from `STORAGES` if it's available,
@@ -8,9 +8,34 @@ LOCAL_DOCS_DIR = pathlib.Path("docs/_build")
 
 @invoke.task
 def build(context: invoke.Context):
-    """Build documentation."""
+    """Build documentation.
+
+    Only changed sources are rebuilt, use `build-clean` for full rebuild.
+
+    """
     saritasa_invocations.print_success("Start building of local documentation")
+    _run_sphinx_build(context)
+    saritasa_invocations.print_success("Building completed")
+
+
+@invoke.task
+def build_clean(context: invoke.Context):
+    """Build documentation from scratch.
+
+    Saved environment is discarded and all files are rebuilt, so warnings
+    are reported for all sources.
+
+    """
+    saritasa_invocations.print_success("Start full building of documentation")
+    _run_sphinx_build(context, params="-E -a")
+    saritasa_invocations.print_success("Building completed")
+
+
+def _run_sphinx_build(context: invoke.Context, params: str = ""):
+    """Run sphinx-build for local documentation."""
     context.run(
-        f"sphinx-build -E -a docs {LOCAL_DOCS_DIR} --exception-on-warning",
+        f"sphinx-build -j auto {params} docs {LOCAL_DOCS_DIR} "
+        "--exception-on-warning",
+        # Build is not interactive, no need to allocate pseudo-terminal
+        pty=False,
     )
-    saritasa_invocations.print_success("Building completed")
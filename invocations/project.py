@@ -1,3 +1,4 @@
+import concurrent.futures
 import pathlib
 import shutil
 
@@ -29,19 +30,29 @@ def clear(context: invoke.Context):
     coverage_dirs = ("htmlcov",)
     cache_dirs = (".mypy_cache", ".pytest_cache")
 
-    saritasa_invocations.print_success("Remove cache directories")
-    for directory in build_dirs + coverage_dirs + cache_dirs:
-        shutil.rmtree(directory, ignore_errors=True)
-
     cwd = pathlib.Path()
-    # remove egg paths
-    saritasa_invocations.print_success("Remove egg directories")
-    for path in cwd.glob("*.egg-info"):
+    paths = [
+        pathlib.Path(directory)
+        for directory in build_dirs + coverage_dirs + cache_dirs
+    ]
+    # egg paths
+    paths.extend(cwd.glob("*.egg-info"))
+    paths.extend(cwd.glob("*.egg"))
+    # last coverage file
+    paths.append(pathlib.Path(".coverage"))
+
+    saritasa_invocations.print_success(
+        "Remove cache, build, egg directories and coverage file",
+    )
+    # Removal is bound by file system calls, so directories are removed in
+    # threads concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_remove_path, paths))
+
+
+def _remove_path(path: pathlib.Path):
+    """Remove directory or file if it exists."""
+    if path.is_dir() and not path.is_symlink():
         shutil.rmtree(path, ignore_errors=True)
-
-    for path in cwd.glob("*.egg"):
+    else:
         path.unlink(missing_ok=True)
-
-    # remove last coverage file
-    saritasa_invocations.print_success("Remove coverage file")
-    pathlib.Path(".coverage").unlink(missing_ok=True)
@@ -3,15 +3,6 @@ from django.conf import settings
 import pytest
 
 
-def pytest_configure() -> None:
-    """Set up Django settings for tests.
-
-    `pytest` automatically calls this function once when tests are run.
-
-    """
-    settings.TESTING = True
-
-
 @pytest.fixture(scope="session", autouse=True)
 def django_db_setup(django_db_setup):
     """Set up test db for testing."""
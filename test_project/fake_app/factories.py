@@ -8,6 +8,10 @@ from import_export_extensions.models import ExportJob, ImportJob
 from . import models
 from .resources import SimpleArtistResource
 
+# Resource used to generate import files, export doesn't change its state,
+# so single instance is shared between factory calls
+SIMPLE_ARTIST_RESOURCE = SimpleArtistResource()
+
 
 class InstrumentFactory(factory.django.DjangoModelFactory):
     """Simple factory for ``Instrument`` model."""
@@ -69,8 +73,6 @@ class ArtistImportJobFactory(factory.django.DjangoModelFactory):
     @factory.lazy_attribute
     def data_file(self):
         """Generate `data_file` based on passed `artists`."""
-        resource = SimpleArtistResource()
-
         if not self.is_valid_file:
             # Append not existing artist with a non-existent instrument
             # to violate the not-null constraint
@@ -78,10 +80,9 @@ class ArtistImportJobFactory(factory.django.DjangoModelFactory):
                 ArtistFactory.build(instrument=InstrumentFactory.build()),
             )
 
-        dataset = resource.export(self.artists)
+        dataset = SIMPLE_ARTIST_RESOURCE.export(self.artists)
         export_data = formats.CSV().export_data(dataset)
-        content = django_files.ContentFile(export_data)
-        return django_files.File(content.file, "data.csv")
+        return django_files.ContentFile(export_data, name="data.csv")
 
 
 class ArtistExportJobFactory(factory.django.DjangoModelFactory):
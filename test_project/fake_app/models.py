@@ -80,5 +80,20 @@ class Membership(models.Model):
         verbose_name_plural = _("Memberships")
 
     def __str__(self) -> str:
-        """Return string representation."""
-        return f"<{self.artist}> joined <{self.band}> on <{self.date_joined}>"
+        """Return string representation.
+
+        Related objects are used only if they are already loaded, to avoid
+        extra queries.
+
+        """
+        artist = (
+            self.artist
+            if Membership.artist.is_cached(self)
+            else f"Artist #{self.artist_id}"
+        )
+        band = (
+            self.band
+            if Membership.band.is_cached(self)
+            else f"Band #{self.band_id}"
+        )
+        return f"<{artist}> joined <{band}> on <{self.date_joined}>"
@@ -1,9 +1,13 @@
+from django.db.models import Prefetch
+
+from import_export.instance_loaders import CachedInstanceLoader
+
 from import_export_extensions.fields import IntermediateManyToManyField
 from import_export_extensions.resources import CeleryModelResource
 from import_export_extensions.widgets import IntermediateManyToManyWidget
 
 from .filters import ArtistFilterSet
-from .models import Artist, Band
+from .models import Artist, Band, Membership
 
 
 class SimpleArtistResource(CeleryModelResource):
@@ -14,6 +18,8 @@ class SimpleArtistResource(CeleryModelResource):
     class Meta:
         model = Artist
         import_id_fields = ["external_id"]
+        # Load all existing artists from dataset with a single query
+        instance_loader_class = CachedInstanceLoader
         clean_model_instances = True
         fields = [
             "id",
@@ -22,6 +28,11 @@ class SimpleArtistResource(CeleryModelResource):
             "instrument",
         ]
 
+    def get_queryset(self):
+        """Return a queryset."""
+        # `instrument` is rendered for each exported artist
+        return super().get_queryset().select_related("instrument")
+
 
 class ArtistResourceWithM2M(CeleryModelResource):
     """Artist resource with Many2Many field."""
@@ -47,9 +58,12 @@ class ArtistResourceWithM2M(CeleryModelResource):
         return (
             super()
             .get_queryset()
+            .select_related("instrument")
             .prefetch_related(
-                "membership_set__band",
-                "bands",
+                Prefetch(
+                    "membership_set",
+                    queryset=Membership.objects.select_related("band"),
+                ),
             )
         )
 
@@ -79,7 +93,12 @@ class BandResourceWithM2M(CeleryModelResource):
             super()
             .get_queryset()
             .prefetch_related(
-                "membership_set__artist",
-                "artists",
+                Prefetch(
+                    "membership_set",
+                    # Only fields rendered by `artists` widget are loaded
+                    queryset=Membership.objects.select_related(
+                        "artist",
+                    ).only("band", "date_joined", "artist__name"),
+                ),
             )
         )
@@ -1,4 +1,5 @@
 import pathlib
+import sys
 
 import decouple
 
@@ -10,7 +11,8 @@ SECRET_KEY = "a87082n4v52u4rnvk2edv128eudfvn5"  # noqa: S105
 ALLOWED_HOSTS = ["*"]
 
 DEBUG = True
-TESTING = False
+# Settings are loaded by pytest-django when tests are run
+TESTING = "pytest" in sys.modules
 
 # Application definition
 
@@ -135,16 +137,8 @@ CELERY_TASK_DEFAULT_QUEUE = "development"
 # https://docs.djangoproject.com/en/dev/ref/settings/#std-setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
-if DEBUG:
+# Debug toolbar is not used in tests, but its middleware handles every
+# request, so it's enabled only outside of tests
+if DEBUG and not TESTING:
     INSTALLED_APPS += ("debug_toolbar",)
     MIDDLEWARE += ("debug_toolbar.middleware.DebugToolbarMiddleware",)
-
-    def _show_toolbar_callback(request) -> bool:
-        """Show debug toolbar exclude testing."""
-        from django.conf import settings
-
-        return not settings.TESTING
-
-    DEBUG_TOOLBAR_CONFIG = {
-        "SHOW_TOOLBAR_CALLBACK": _show_toolbar_callback,
-    }
@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils.encoding import force_bytes
 
 from rest_framework import test
 
@@ -65,7 +66,7 @@ def uploaded_file(existing_artist: Artist) -> SimpleUploadedFile:
     import_job = ArtistImportJobFactory.build(artists=[existing_artist])
     return SimpleUploadedFile(
         "test_file.csv",
-        content=import_job.data_file.file.read().encode(),
+        content=force_bytes(import_job.data_file.read()),
         content_type="text/plain",
     )
 
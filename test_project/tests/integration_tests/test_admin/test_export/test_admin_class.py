@@ -81,9 +81,7 @@ def test_get_fieldsets_by_export_job_status(
     mocker.patch(
         "import_export_extensions.models.ExportJob.export_data",
     )
-    job: ExportJob = ArtistExportJobFactory()
-    job.export_status = job_status
-    job.save()
+    job: ExportJob = ArtistExportJobFactory(export_status=job_status)
 
     response = client.get(
         reverse(
@@ -5,7 +5,6 @@ from django.urls import reverse
 from rest_framework import status
 
 import pytest
-import pytest_mock
 
 from import_export_extensions.models import ExportJob
 from test_project.fake_app.factories import ArtistExportJobFactory
@@ -14,15 +13,13 @@ from test_project.fake_app.factories import ArtistExportJobFactory
 def test_celery_export_status_view_during_export(
     client: Client,
     superuser: User,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test export status page when export in progress."""
     client.force_login(superuser)
 
-    mocker.patch("import_export_extensions.tasks.export_data_task.apply_async")
-    artist_export_job = ArtistExportJobFactory()
-    artist_export_job.export_status = ExportJob.ExportStatus.EXPORTING
-    artist_export_job.save()
+    artist_export_job = ArtistExportJobFactory(
+        export_status=ExportJob.ExportStatus.EXPORTING,
+    )
 
     response = client.get(
         path=reverse(
@@ -52,15 +49,13 @@ def test_celery_export_results_view_redirect_to_status_page(
     client: Client,
     superuser: User,
     incorrect_job_status: ExportJob.ExportStatus,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test redirect to export status page when job in not results statuses."""
     client.force_login(superuser)
 
-    mocker.patch("import_export_extensions.tasks.export_data_task.apply_async")
-    artist_export_job = ArtistExportJobFactory()
-    artist_export_job.export_status = incorrect_job_status
-    artist_export_job.save()
+    artist_export_job = ArtistExportJobFactory(
+        export_status=incorrect_job_status,
+    )
 
     response = client.get(
         path=reverse(
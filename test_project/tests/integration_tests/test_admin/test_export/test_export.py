@@ -10,12 +10,16 @@ from celery import states
 from pytest_lazy_fixtures import lf
 
 from import_export_extensions.models import ExportJob
+from import_export_extensions.resources import TaskState
 from test_project.fake_app.factories import ArtistExportJobFactory
 
 
 @pytest.mark.usefixtures("existing_artist")
-@pytest.mark.django_db(transaction=True)
-def test_export_using_admin_model(client: Client, superuser: User):
+def test_export_using_admin_model(
+    client: Client,
+    superuser: User,
+    django_capture_on_commit_callbacks,
+):
     """Test entire exporting process using Django Admin.
 
     There is following workflow:
@@ -33,12 +37,13 @@ def test_export_using_admin_model(client: Client, superuser: User):
     assert export_get_response.status_code == status.HTTP_200_OK
 
     # Start export job using admin panel
-    start_export_response = client.post(
-        path=reverse("admin:fake_app_artist_export"),
-        data={
-            "format": 0,
-        },
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        start_export_response = client.post(
+            path=reverse("admin:fake_app_artist_export"),
+            data={
+                "format": 0,
+            },
+        )
     assert start_export_response.status_code == status.HTTP_302_FOUND
 
     # Go to redirected page after export is finished
@@ -48,8 +53,8 @@ def test_export_using_admin_model(client: Client, superuser: User):
     result_response = client.get(status_response.url)
     assert result_response.status_code == status.HTTP_200_OK
 
-    assert ExportJob.objects.exists()
     export_job = ExportJob.objects.first()
+    assert export_job is not None
     assert export_job.export_status == ExportJob.ExportStatus.EXPORTED
 
 
@@ -96,7 +101,6 @@ def test_export_using_admin_model_without_permissions(
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
-@pytest.mark.django_db(transaction=True)
 def test_export_progress_during_export(
     client: Client,
     superuser: User,
@@ -110,6 +114,10 @@ def test_export_progress_during_export(
         "current": 2,
         "total": 3,
     }
+    mocker.patch(
+        "celery.result.AsyncResult.state",
+        new=TaskState.EXPORTING.name,
+    )
     mocker.patch(
         "celery.result.AsyncResult.info",
         new=fake_progress_info,
@@ -118,9 +126,9 @@ def test_export_progress_during_export(
         fake_progress_info["current"] / fake_progress_info["total"] * 100,
     )
 
-    artist_export_job = ArtistExportJobFactory()
-    artist_export_job.export_status = ExportJob.ExportStatus.EXPORTING
-    artist_export_job.save()
+    artist_export_job = ArtistExportJobFactory(
+        export_status=ExportJob.ExportStatus.EXPORTING,
+    )
 
     response = client.post(
         path=reverse(
@@ -133,22 +141,22 @@ def test_export_progress_during_export(
 
     assert json_data == {
         "status": ExportJob.ExportStatus.EXPORTING.title(),
-        "state": "SUCCESS",
+        "state": TaskState.EXPORTING.name,
         "percent": expected_percent,
         **fake_progress_info,
     }
 
 
-@pytest.mark.django_db(transaction=True)
 def test_export_progress_after_complete_export(
     client: Client,
     superuser: User,
+    django_capture_on_commit_callbacks,
 ):
     """Test export job admin progress page after complete export."""
     client.force_login(superuser)
 
-    artist_export_job = ArtistExportJobFactory()
-    artist_export_job.refresh_from_db()
+    with django_capture_on_commit_callbacks(execute=True):
+        artist_export_job = ArtistExportJobFactory()
 
     response = client.post(
         path=reverse(
@@ -158,20 +166,17 @@ def test_export_progress_after_complete_export(
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {
-        "status": artist_export_job.export_status.title(),
+        "status": ExportJob.ExportStatus.EXPORTED.title(),
     }
 
 
-@pytest.mark.django_db(transaction=True)
 def test_export_progress_with_deleted_export_job(
     client: Client,
     superuser: User,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test export job admin progress page with deleted export job."""
     client.force_login(superuser)
 
-    mocker.patch("import_export_extensions.tasks.export_data_task.apply_async")
     artist_export_job = ArtistExportJobFactory()
     job_id = artist_export_job.id
     artist_export_job.delete()
@@ -191,7 +196,6 @@ def test_export_progress_with_deleted_export_job(
     assert response.json()["validation_error"] == expected_error_message
 
 
-@pytest.mark.django_db(transaction=True)
 def test_export_progress_with_failed_celery_task(
     client: Client,
     superuser: User,
@@ -209,9 +213,9 @@ def test_export_progress_with_failed_celery_task(
         "celery.result.AsyncResult.info",
         new=ValueError(expected_error_message),
     )
-    artist_export_job = ArtistExportJobFactory()
-    artist_export_job.export_status = ExportJob.ExportStatus.EXPORTING
-    artist_export_job.save()
+    artist_export_job = ArtistExportJobFactory(
+        export_status=ExportJob.ExportStatus.EXPORTING,
+    )
 
     response = client.post(
         path=reverse(
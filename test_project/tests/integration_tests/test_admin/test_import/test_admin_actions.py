@@ -1,4 +1,5 @@
 from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
 from django.test.client import Client
 from django.urls import reverse
 
@@ -11,7 +12,6 @@ from import_export_extensions.models import ImportJob
 from test_project.fake_app.factories import ArtistImportJobFactory
 
 
-@pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize(
     argnames="allowed_cancel_status",
     argvalues=[
@@ -31,9 +31,9 @@ def test_cancel_import_admin_action(
     client.force_login(superuser)
 
     revoke_mock = mocker.patch("celery.current_app.control.revoke")
-    artist_import_job = ArtistImportJobFactory()
-    artist_import_job.import_status = allowed_cancel_status
-    artist_import_job.save()
+    artist_import_job = ArtistImportJobFactory(
+        import_status=allowed_cancel_status,
+    )
 
     response = client.post(
         reverse("admin:import_export_extensions_importjob_changelist"),
@@ -41,20 +41,16 @@ def test_cancel_import_admin_action(
             "action": "cancel_jobs",
             "_selected_action": [artist_import_job.pk],
         },
-        follow=True,
     )
     artist_import_job.refresh_from_db()
 
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_302_FOUND
     assert artist_import_job.import_status == ImportJob.ImportStatus.CANCELLED
-    assert (
-        response.context["messages"]._loaded_data[0].message
-        == f"Import of {artist_import_job} canceled"
-    )
+    messages = list(get_messages(response.wsgi_request))
+    assert messages[0].message == f"Import of {artist_import_job} canceled"
     revoke_mock.assert_called_once()
 
 
-@pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize(
     argnames="incorrect_job_status",
     argvalues=[
@@ -75,9 +71,9 @@ def test_cancel_import_admin_action_with_incorrect_import_job_status(
     client.force_login(superuser)
 
     revoke_mock = mocker.patch("celery.current_app.control.revoke")
-    artist_import_job = ArtistImportJobFactory()
-    artist_import_job.import_status = incorrect_job_status
-    artist_import_job.save()
+    artist_import_job = ArtistImportJobFactory(
+        import_status=incorrect_job_status,
+    )
 
     expected_error_message = (
         f"ImportJob with id {artist_import_job.pk} has incorrect status"
@@ -89,24 +85,21 @@ def test_cancel_import_admin_action_with_incorrect_import_job_status(
             "action": "cancel_jobs",
             "_selected_action": [artist_import_job.pk],
         },
-        follow=True,
     )
     artist_import_job.refresh_from_db()
 
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_302_FOUND
     assert artist_import_job.import_status == incorrect_job_status
-    assert (
-        expected_error_message
-        in response.context["messages"]._loaded_data[0].message
-    )
+    messages = list(get_messages(response.wsgi_request))
+    assert expected_error_message in messages[0].message
     revoke_mock.assert_not_called()
 
 
-@pytest.mark.django_db(transaction=True)
 def test_confirm_import_admin_action(
     client: Client,
     superuser: User,
     mocker: pytest_mock.MockerFixture,
+    django_capture_on_commit_callbacks,
 ):
     """Test `confirm_import` via admin action."""
     client.force_login(superuser)
@@ -114,29 +107,26 @@ def test_confirm_import_admin_action(
     import_data_mock = mocker.patch(
         "import_export_extensions.models.ImportJob.import_data",
     )
-    artist_import_job = ArtistImportJobFactory()
-    artist_import_job.refresh_from_db()
-
-    response = client.post(
-        reverse("admin:import_export_extensions_importjob_changelist"),
-        data={
-            "action": "confirm_jobs",
-            "_selected_action": [artist_import_job.pk],
-        },
-        follow=True,
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        artist_import_job = ArtistImportJobFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            reverse("admin:import_export_extensions_importjob_changelist"),
+            data={
+                "action": "confirm_jobs",
+                "_selected_action": [artist_import_job.pk],
+            },
+        )
     artist_import_job.refresh_from_db()
 
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_302_FOUND
     assert artist_import_job.import_status == ImportJob.ImportStatus.CONFIRMED
-    assert (
-        response.context["messages"]._loaded_data[0].message
-        == f"Import of {artist_import_job} confirmed"
-    )
+    messages = list(get_messages(response.wsgi_request))
+    assert messages[0].message == f"Import of {artist_import_job} confirmed"
     import_data_mock.assert_called_once()
 
 
-@pytest.mark.django_db(transaction=True)
 def test_confirm_import_admin_action_with_incorrect_import_job_status(
     client: Client,
     superuser: User,
@@ -144,9 +134,9 @@ def test_confirm_import_admin_action_with_incorrect_import_job_status(
     """Test `confirm_import` via admin action with wrong import job status."""
     client.force_login(superuser)
 
-    artist_import_job = ArtistImportJobFactory()
-    artist_import_job.import_status = ImportJob.ImportStatus.CANCELLED
-    artist_import_job.save()
+    artist_import_job = ArtistImportJobFactory(
+        import_status=ImportJob.ImportStatus.CANCELLED,
+    )
 
     expected_error_message = (
         f"ImportJob with id {artist_import_job.pk} has incorrect status"
@@ -158,13 +148,10 @@ def test_confirm_import_admin_action_with_incorrect_import_job_status(
             "action": "confirm_jobs",
             "_selected_action": [artist_import_job.pk],
         },
-        follow=True,
     )
     artist_import_job.refresh_from_db()
 
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_302_FOUND
     assert artist_import_job.import_status == ImportJob.ImportStatus.CANCELLED
-    assert (
-        expected_error_message
-        in response.context["messages"]._loaded_data[0].message
-    )
+    messages = list(get_messages(response.wsgi_request))
+    assert expected_error_message in messages[0].message
@@ -58,9 +58,7 @@ def test_get_fieldsets_by_import_job_status(
     mocker.patch(
         "import_export_extensions.models.ImportJob.import_data",
     )
-    artist_import_job = ArtistImportJobFactory()
-    artist_import_job.import_status = job_status
-    artist_import_job.save()
+    artist_import_job = ArtistImportJobFactory(import_status=job_status)
 
     response = client.get(
         reverse(
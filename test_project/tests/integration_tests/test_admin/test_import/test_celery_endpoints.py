@@ -5,7 +5,6 @@ from django.urls import reverse
 from rest_framework import status
 
 import pytest
-import pytest_mock
 
 from import_export_extensions.models import ImportJob
 from test_project.fake_app.factories import ArtistImportJobFactory
@@ -14,15 +13,14 @@ from test_project.fake_app.factories import ArtistImportJobFactory
 def test_celery_import_status_view_during_import(
     client: Client,
     superuser: User,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test import status page when import in progress."""
     client.force_login(superuser)
 
-    mocker.patch("import_export_extensions.tasks.parse_data_task.apply_async")
-    artist_import_job = ArtistImportJobFactory(skip_parse_step=True)
-    artist_import_job.import_status = ImportJob.ImportStatus.IMPORTING
-    artist_import_job.save()
+    artist_import_job = ArtistImportJobFactory(
+        skip_parse_step=True,
+        import_status=ImportJob.ImportStatus.IMPORTING,
+    )
 
     response = client.get(
         path=reverse(
@@ -55,15 +53,13 @@ def test_celery_import_results_view_redirect_to_status_page(
     client: Client,
     superuser: User,
     incorrect_job_status: ImportJob.ImportStatus,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test redirect to import status page when job in not result status."""
     client.force_login(superuser)
 
-    mocker.patch("import_export_extensions.tasks.parse_data_task.apply_async")
-    artist_import_job = ArtistImportJobFactory()
-    artist_import_job.import_status = incorrect_job_status
-    artist_import_job.save()
+    artist_import_job = ArtistImportJobFactory(
+        import_status=incorrect_job_status,
+    )
 
     response = client.get(
         path=reverse(
@@ -92,15 +88,13 @@ def test_celery_import_results_confirm_forbidden(
     client: Client,
     superuser: User,
     incorrect_job_status: ImportJob.ImportStatus,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Check that confirm from result page forbidden for not PARSED jobs."""
     client.force_login(superuser)
 
-    mocker.patch("import_export_extensions.tasks.parse_data_task.apply_async")
-    artist_import_job = ArtistImportJobFactory()
-    artist_import_job.import_status = incorrect_job_status
-    artist_import_job.save()
+    artist_import_job = ArtistImportJobFactory(
+        import_status=incorrect_job_status,
+    )
 
     response = client.post(
         path=reverse(
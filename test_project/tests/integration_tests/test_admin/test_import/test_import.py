@@ -11,15 +11,16 @@ from celery import states
 from pytest_lazy_fixtures import lf
 
 from import_export_extensions.models import ImportJob
+from import_export_extensions.resources import TaskState
 from test_project.fake_app.factories import ArtistImportJobFactory
 
 
 @pytest.mark.usefixtures("existing_artist")
-@pytest.mark.django_db(transaction=True)
 def test_import_using_admin_model(
     client: Client,
     superuser: User,
     uploaded_file: SimpleUploadedFile,
+    django_capture_on_commit_callbacks,
 ):
     """Test entire importing process using Django Admin.
 
@@ -41,13 +42,14 @@ def test_import_using_admin_model(
     assert import_response.status_code == status.HTTP_200_OK
 
     # Start import job using admin panel
-    start_import_job_response = client.post(
-        path=reverse("admin:fake_app_artist_import"),
-        data={
-            "import_file": uploaded_file,
-            "format": 0,  # Choose CSV format
-        },
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        start_import_job_response = client.post(
+            path=reverse("admin:fake_app_artist_import"),
+            data={
+                "import_file": uploaded_file,
+                "format": 0,  # Choose CSV format
+            },
+        )
     assert start_import_job_response.status_code == status.HTTP_302_FOUND
 
     # Go to import job status page
@@ -55,19 +57,19 @@ def test_import_using_admin_model(
     status_page_response = client.get(path=start_import_job_response.url)
     assert status_page_response.status_code == status.HTTP_302_FOUND
 
-    assert ImportJob.objects.exists()
-
     import_job = ImportJob.objects.first()
+    assert import_job is not None
 
     # Go to results page
     result_page_get_response = client.get(status_page_response.url)
     assert result_page_get_response.status_code == status.HTTP_200_OK
 
     # Confirm import on result page
-    confirm_response = client.post(
-        path=status_page_response.url,
-        data={"confirm": "Confirm import"},
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        confirm_response = client.post(
+            path=status_page_response.url,
+            data={"confirm": "Confirm import"},
+        )
     assert confirm_response.status_code == status.HTTP_302_FOUND
 
     # Ensure import job finished and redirected to result page
@@ -138,7 +140,7 @@ def test_import_admin_has_same_formats(
     """
     client.force_login(superuser)
     artist_import_job.import_status = ImportJob.ImportStatus.IMPORTED
-    artist_import_job.save()
+    artist_import_job.save(update_fields=["import_status"])
     import_response = client.get(
         path=reverse("admin:fake_app_artist_import"),
     )
@@ -158,7 +160,6 @@ def test_import_admin_has_same_formats(
     )
 
 
-@pytest.mark.django_db(transaction=True)
 def test_import_progress_during_import(
     client: Client,
     superuser: User,
@@ -172,6 +173,10 @@ def test_import_progress_during_import(
         "current": 2,
         "total": 3,
     }
+    mocker.patch(
+        "celery.result.AsyncResult.state",
+        new=TaskState.IMPORTING.name,
+    )
     mocker.patch(
         "celery.result.AsyncResult.info",
         new=fake_progress_info,
@@ -182,9 +187,8 @@ def test_import_progress_during_import(
 
     artist_import_job = ArtistImportJobFactory(
         skip_parse_step=True,
+        import_status=ImportJob.ImportStatus.IMPORTING,
     )
-    artist_import_job.import_status = ImportJob.ImportStatus.IMPORTING
-    artist_import_job.save()
 
     response = client.post(
         path=reverse(
@@ -196,24 +200,24 @@ def test_import_progress_during_import(
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {
         "status": ImportJob.ImportStatus.IMPORTING.title(),
-        "state": "SUCCESS",
+        "state": TaskState.IMPORTING.name,
         "percent": expected_percent,
         **fake_progress_info,
     }
 
 
-@pytest.mark.django_db(transaction=True)
 def test_import_progress_after_complete_import(
     client: Client,
     superuser: User,
+    django_capture_on_commit_callbacks,
 ):
     """Test import job admin progress page after complete import."""
     client.force_login(superuser)
 
-    artist_import_job = ArtistImportJobFactory(
-        skip_parse_step=True,
-    )
-    artist_import_job.refresh_from_db()
+    with django_capture_on_commit_callbacks(execute=True):
+        artist_import_job = ArtistImportJobFactory(
+            skip_parse_step=True,
+        )
 
     response = client.post(
         path=reverse(
@@ -223,20 +227,17 @@ def test_import_progress_after_complete_import(
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {
-        "status": artist_import_job.import_status.title(),
+        "status": ImportJob.ImportStatus.IMPORTED.title(),
     }
 
 
-@pytest.mark.django_db(transaction=True)
 def test_import_progress_with_deleted_import_job(
     client: Client,
     superuser: User,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test import job admin progress page with deleted import job."""
     client.force_login(superuser)
 
-    mocker.patch("import_export_extensions.tasks.import_data_task.apply_async")
     artist_import_job = ArtistImportJobFactory()
     job_id = artist_import_job.id
     artist_import_job.delete()
@@ -256,7 +257,6 @@ def test_import_progress_with_deleted_import_job(
     assert response.json()["validation_error"] == expected_error_message
 
 
-@pytest.mark.django_db(transaction=True)
 def test_import_progress_with_failed_celery_task(
     client: Client,
     superuser: User,
@@ -274,11 +274,10 @@ def test_import_progress_with_failed_celery_task(
         "celery.result.AsyncResult.info",
         new=ValueError(expected_error_message),
     )
-    artist_import_job = ArtistImportJobFactory()
-    artist_import_job.refresh_from_db()
-    artist_import_job.confirm_import()
-    artist_import_job.import_status = ImportJob.ImportStatus.IMPORTING
-    artist_import_job.save()
+    artist_import_job = ArtistImportJobFactory(
+        skip_parse_step=True,
+        import_status=ImportJob.ImportStatus.IMPORTING,
+    )
 
     response = client.post(
         path=reverse(
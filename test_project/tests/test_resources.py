@@ -1,12 +1,20 @@
+import io
 import re
 
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.files import File
+from django.core.files.storage import default_storage
 
 from rest_framework.exceptions import ValidationError
 
 import pytest
+import tablib
+from import_export import fields
+from pytest_mock import MockerFixture
 
 from import_export_extensions import results
+from import_export_extensions.resources import CeleryResource
+from import_export_extensions.widgets import FileWidget
 from test_project.fake_app.factories import ArtistFactory
 from test_project.fake_app.models import Artist
 
@@ -18,6 +26,14 @@ def test_resource_get_queryset(existing_artist: Artist):
     assert existing_artist in SimpleArtistResource().get_queryset()
 
 
+def test_resource_export_with_single_query(django_assert_num_queries):
+    """Check that export doesn't fetch instruments of each artist."""
+    ArtistFactory.create_batch(3)
+    with django_assert_num_queries(1):
+        dataset = SimpleArtistResource().export()
+    assert len(dataset) == 3
+
+
 def test_resource_with_filter_kwargs(existing_artist: Artist):
     """Check that `get_queryset` with filter kwargs exclude existing artist."""
     expected_artist_name = "Expected Artist"
@@ -70,3 +86,41 @@ def test_resource_get_error_class():
     """Ensure that CeleryResource overrides error class."""
     error_class = SimpleArtistResource().get_error_result_class()
     assert error_class is results.Error
+
+
+def test_resource_get_supported_extensions_map_is_cached():
+    """Ensure extensions map is built once per resource class."""
+    get_extensions_map = SimpleArtistResource.get_supported_extensions_map
+    extensions_map = get_extensions_map()
+    assert extensions_map is get_extensions_map()
+    assert "csv" in extensions_map
+
+
+def test_resource_primes_file_widgets(mocker: MockerFixture):
+    """Ensure primed files are reset after import, even if it is failed."""
+
+    class FileResource(CeleryResource):
+        file = fields.Field(
+            column_name="file",
+            widget=FileWidget(filename="file", prime_existing_files=True),
+        )
+
+    filename = default_storage.save("original", File(io.BytesIO(b"value")))
+    dataset = tablib.Dataset(
+        (f"http://localhost/media/{filename}",),
+        headers=["file"],
+    )
+    resource = FileResource()
+    widget = resource.fields["file"].widget
+
+    resource.before_import(dataset)
+    assert widget._existing_files == {filename}
+
+    mocker.patch.object(
+        resource,
+        "import_data_inner",
+        side_effect=ValueError("Import failed"),
+    )
+    with pytest.raises(ValueError, match="Import failed"):
+        resource.import_data(dataset)
+    assert not widget._existing_files
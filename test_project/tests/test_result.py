@@ -40,3 +40,16 @@ def test_row_result_properties(
     """Check that row result properties calculate value correct."""
     assert row_result_with_skipped_errors.has_skipped_errors
     assert row_result_with_skipped_errors.skipped_errors_count == 2
+
+
+def test_error_stores_string():
+    """Ensure error is converted to string on init and keeps traceback."""
+    with pytest.raises(ValueError, match="Invalid value") as exception_info:
+        raise ValueError("Invalid value")
+    error = results.Error(exception_info.value)
+    assert error.error == "Invalid value"
+    assert "ValueError: Invalid value" in error.traceback
+
+    restored_error = pickle.loads(pickle.dumps(error))  # noqa: S301
+    assert restored_error.error == "Invalid value"
+    assert restored_error.traceback == error.traceback
@@ -26,6 +26,11 @@ AWS_STORAGE_BUCKET_NAME = "test-bucket-name"
             "text/csv",
             id="File url with GET params",
         ),
+        pytest.param(
+            "media/file#1.csv",
+            "text/csv",
+            id="File name with '#'",
+        ),
     ],
 )
 def test_get_mime_type_by_file_url(
@@ -36,6 +41,48 @@ def test_get_mime_type_by_file_url(
     assert utils.get_mime_type_by_file_url(file_url) == expected_mime_type
 
 
+@pytest.mark.parametrize(
+    argnames=["file_url", "expected_extension"],
+    argvalues=[
+        pytest.param("dir/subdir/file.EXT", ".ext", id="Path to file"),
+        pytest.param(
+            "http://testdownload.org/file.csv?width=10#top",
+            ".csv",
+            id="File url with GET params and fragment",
+        ),
+        pytest.param("media/file#1.csv", ".csv", id="File name with '#'"),
+        pytest.param("http://[abc/", "", id="Malformed url"),
+        pytest.param("dir.ext/file", "", id="File without extension"),
+        pytest.param("dir/.hidden", "", id="Hidden file"),
+    ],
+)
+def test_get_file_extension(file_url: str, expected_extension: str):
+    """Check that file extension is extracted correctly."""
+    assert utils.get_file_extension(file_url) == expected_extension
+
+
+@pytest.mark.parametrize(
+    argnames=["ignore_empty", "expected_values"],
+    argvalues=[
+        pytest.param(True, ["a", "b c"], id="Ignore empty values"),
+        pytest.param(False, ["a", "", "b c"], id="Keep empty values"),
+    ],
+)
+def test_split_and_clean_string_values(
+    ignore_empty: bool,
+    expected_values: list[str],
+):
+    """Check that string is split and each part is cleaned."""
+    assert (
+        utils.split_and_clean_string_values(
+            " a ;  ; b\n c ",
+            ";",
+            ignore_empty=ignore_empty,
+        )
+        == expected_values
+    )
+
+
 def test_clear_q_filter():
     """Check that filter is cleaned correctly."""
     value = "Hello world"
@@ -1,7 +1,9 @@
 import io
+import re
 
 from django.core.files import File
 from django.core.files.storage import default_storage
+from django.db.models import QuerySet
 from django.db.models.fields.files import FieldFile
 from django.forms import ValidationError
 
@@ -228,6 +230,57 @@ def test_clean_if_in_db_few_with_same_attr():
     assert {item["object"] for item in result} == {band_1, band_2}
 
 
+def test_clean_fetches_related_objects_with_single_query(
+    django_assert_num_queries,
+):
+    """Ensure related objects for all instances are fetched at once."""
+    bands = [BandFactory(title=f"Band {number}") for number in range(3)]
+    widget = IntermediateManyToManyWidget(
+        rem_model=Band,
+        rem_field="title",
+        instance_separator=";",
+    )
+    with django_assert_num_queries(1):
+        result = widget.clean(";".join(band.title for band in bands))
+
+    assert [item["object"] for item in result] == bands
+
+
+def test_clean_with_overridden_filter_instances():
+    """Ensure customized ``filter_instances`` is used for each instance."""
+
+    class VisibleBandsWidget(IntermediateManyToManyWidget):
+        def filter_instances(self, rem_field_value: str) -> QuerySet:
+            queryset = super().filter_instances(rem_field_value)
+            return queryset.exclude(title="Hidden")
+
+    BandFactory(title="Keep")
+    BandFactory(title="Hidden")
+    widget = VisibleBandsWidget(
+        rem_model=Band,
+        rem_field="title",
+        instance_separator=";",
+    )
+    with pytest.raises(
+        ValueError,
+        match=re.escape("You are trying import invalid values: ['Hidden']"),
+    ):
+        widget.clean("Keep;Hidden")
+
+
+def test_clean_with_invalid_values(band: Band):
+    """Ensure invalid values are reported along with valid ones."""
+    widget = IntermediateManyToManyWidget(
+        rem_model=Band,
+        instance_separator=";",
+    )
+    with pytest.raises(
+        ValueError,
+        match=re.escape("You are trying import invalid values: ['abc']"),
+    ):
+        widget.clean(f"abc;{band.pk}")
+
+
 def test_clean_nonexistent_relations():
     """Test raise `ValueError` if we try to import nonexistent relations."""
     raw_data = "Some band title"
@@ -323,6 +376,52 @@ def test_clean_extra_properties_with_too_many_prop_separators(
         widget.clean_instance(raw_data)
 
 
+def test_optimize_queryset(
+    membership: Membership,
+    django_assert_num_queries,
+):
+    """Ensure optimized queryset renders without extra queries."""
+    MembershipFactory(artist=membership.artist)
+    widget = IntermediateManyToManyWidget(
+        rem_model=Band,
+        rem_field="title",
+        extra_fields=["date_joined", "artist__instrument"],
+        instance_separator=";",
+    )
+    queryset = widget.optimize_queryset(Membership.objects.all())
+    with django_assert_num_queries(1):
+        widget.render(list(queryset))
+
+
+def test_optimize_queryset_rendered_using_values_list():
+    """Ensure related objects aren't selected for ``values_list``."""
+    widget = IntermediateManyToManyWidget(
+        rem_model=Band,
+        rem_field="title",
+        extra_fields=["date_joined", "artist__instrument__title"],
+        instance_separator=";",
+    )
+    queryset = widget.optimize_queryset(Membership.objects.all())
+    assert not queryset.query.select_related
+
+
+def test_render_using_values_list(
+    membership: Membership,
+    django_assert_num_queries,
+):
+    """Ensure not evaluated queryset is rendered using single query."""
+    widget = IntermediateManyToManyWidget(
+        rem_model=Band,
+        rem_field="title",
+        extra_fields=["date_joined"],
+        instance_separator=";",
+    )
+    with django_assert_num_queries(1):
+        result = widget.render(Membership.objects.all())
+
+    assert result == f"{membership.band.title}:{membership.date_joined}"
+
+
 def test_render_empty_values(membership: Membership):
     """Check empty values rendered when `skip_empty` set to False."""
     MembershipFactory(band__title="")
@@ -388,8 +487,8 @@ def test_file_widget_render_link_for_non_local_env(
     widget = FileWidget(filename="test_widget")
     mocker.patch.object(
         widget,
-        "_get_default_storage",
-        return_value="non_local_storage",
+        "_default_storage",
+        new="non_local_storage",
     )
     result = widget.render(import_file)
 
@@ -405,6 +504,25 @@ def test_file_widget_clean_url():
     assert cleaned_result == filename
 
 
+def test_file_widget_clean_primed_url(mocker: MockerFixture):
+    """Test FileWidget `clean` doesn't check existence of primed files."""
+    filename = default_storage.save("original", File(io.BytesIO(b"testvalue")))
+    value = f"http://localhost/media/{filename}"
+    widget = FileWidget(filename="imported_file", prime_existing_files=True)
+    widget.prime([value, None])
+    exists_mock = mocker.patch.object(default_storage, "exists")
+
+    assert widget.clean(value) == filename
+    exists_mock.assert_not_called()
+
+
+def test_file_widget_prime_skips_non_string_values():
+    """Test FileWidget `prime` leaves non-string values for `clean`."""
+    widget = FileWidget(filename="imported_file", prime_existing_files=True)
+    widget.prime([12, 1.5])
+    assert not widget._existing_files
+
+
 def test_file_widget_clean_with_invalid_file_path():
     """Test that FileWidget.clean raise error with invalid file path."""
     widget = FileWidget(filename="imported_file")
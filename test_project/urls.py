@@ -43,8 +43,6 @@ urlpatterns = [re_path("^admin/", admin.site.urls), *ie_router.urls]
 
 # for serving uploaded files on dev environment with django
 if settings.DEBUG:
-    import debug_toolbar
-
     urlpatterns += [
         path(
             "api/schema/",
@@ -56,7 +54,6 @@ if settings.DEBUG:
             SpectacularSwaggerView.as_view(url_name="schema"),
             name="swagger-ui",
         ),
-        path("__debug__/", include(debug_toolbar.urls)),
     ]
 
     urlpatterns += static(
@@ -67,3 +64,8 @@ if settings.DEBUG:
         settings.STATIC_URL,
         document_root=settings.STATIC_ROOT,
     )
+
+if "debug_toolbar" in settings.INSTALLED_APPS:
+    import debug_toolbar
+
+    urlpatterns += [path("__debug__/", include(debug_toolbar.urls))]